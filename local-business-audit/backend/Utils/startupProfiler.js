@@ -0,0 +1,106 @@
+// backend/Utils/startupProfiler.js
+// Cold-start profiler for server.js
+// Enabled only when STARTUP_PROFILE is set to an output path (start_servers.py --profile-startup does this).
+// Times every first-time require(), records startup marks (db connected, listening)
+// and writes a JSON report when the process exits.
+
+const Module = require('module');
+const fs = require('fs');
+const path = require('path');
+const { performance } = require('perf_hooks');
+
+const outputPath = process.env.STARTUP_PROFILE;
+const enabled = !!outputPath;
+const rootDir = path.resolve(__dirname, '..');
+
+const modules = [];
+const marks = {};
+const stack = [];
+let written = false;
+let timedOut = false;
+
+function moduleId(filename) {
+  return path.relative(rootDir, filename).split(path.sep).join('/');
+}
+
+function install() {
+  const originalLoad = Module._load;
+
+  Module._load = function (request, parent, isMain) {
+    let filename;
+    try {
+      filename = Module._resolveFilename(request, parent, isMain);
+    } catch (error) {
+      return originalLoad.apply(this, arguments);
+    }
+
+    // Builtins and cached modules are free - only first loads from disk are measured
+    if (!path.isAbsolute(filename) || Module._cache[filename]) {
+      return originalLoad.apply(this, arguments);
+    }
+
+    const frame = { childMs: 0 };
+    stack.push(frame);
+    const start = performance.now();
+    try {
+      return originalLoad.apply(this, arguments);
+    } finally {
+      const inclusiveMs = performance.now() - start;
+      stack.pop();
+      if (stack.length) stack[stack.length - 1].childMs += inclusiveMs;
+
+      modules.push({
+        id: moduleId(filename),
+        parent: parent && parent.filename ? moduleId(parent.filename) : null,
+        inclusiveMs,
+        selfMs: inclusiveMs - frame.childMs
+      });
+    }
+  };
+}
+
+function writeReport(exitCode) {
+  if (written) return;
+  written = true;
+
+  const report = {
+    pid: process.pid,
+    nodeVersion: process.version,
+    exitCode,
+    timedOut,
+    marks,
+    modules
+  };
+
+  try {
+    fs.writeFileSync(outputPath, JSON.stringify(report));
+  } catch (error) {
+    console.error('❌ Failed to write startup profile:', error.message);
+  }
+}
+
+// Record the first time a startup milestone is reached (ms since process start)
+function mark(name) {
+  if (!enabled || name in marks) return;
+  marks[name] = performance.now();
+}
+
+// Called once the server is ready - ends the profiling run
+function finish() {
+  if (!enabled) return;
+  mark('ready');
+  process.exit(0);
+}
+
+if (enabled) {
+  install();
+  process.on('exit', writeReport);
+
+  // Sent by the launcher when a run never becomes ready - keep the partial profile
+  process.on('SIGUSR2', () => {
+    timedOut = true;
+    process.exit(124);
+  });
+}
+
+module.exports = { enabled, mark, finish };
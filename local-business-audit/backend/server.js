@@ -5,6 +5,9 @@
 // PLUS: Terminal Dashboard for real-time monitoring
 // PLUS: Client Dashboard Content Management APIs
 
+// Startup profiler must load first so it can time every other require (no-op unless STARTUP_PROFILE is set)
+const startupProfiler = require("./Utils/startupProfiler");
+
 const express = require("express");
 const cors = require("cors");
 const helmet = require("helmet");
@@ -39,6 +42,8 @@ const landingRoutes = require('./routes/landing');
 const paymentRoutes = require('./routes/payment');
 const onboardingRoutes = require('./routes/onboarding');
 
+startupProfiler.mark('modules-loaded');
+
 const app = express();
 const PORT = 5000; // Changed from 3001 to 5000 to match your ClientDashboard
 
@@ -170,6 +175,7 @@ async function initializeApp() {
     
     // Start server after database connection
     server.listen(PORT, () => {
+      startupProfiler.mark('listening');
       terminal.success(`🚀 Server started on port ${PORT}`, {
         port: PORT,
         environment: process.env.NODE_ENV || 'development',
@@ -188,6 +194,7 @@ async function initializeApp() {
       terminal.info("🚀 Local Brand Builder Routes active");
       terminal.info("📊 Client Dashboard Content APIs loaded");
       terminal.success("🎯 Ready to generate comprehensive local business audits!");
+      startupProfiler.finish();
     });
   } catch (error) {
     terminal.error("❌ Failed to initialize app", {
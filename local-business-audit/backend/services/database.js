@@ -1,4 +1,5 @@
 const { MongoClient } = require('mongodb');
+const startupProfiler = require('../Utils/startupProfiler');
 
 class DatabaseService {
   constructor() {
@@ -22,12 +23,14 @@ class DatabaseService {
       });
 
       await this.client.connect();
+      startupProfiler.mark('db-connected');
       console.log('✅ Connected to MongoDB Atlas');
 
       this.db = this.client.db('Audit-app');
       
       // Create indexes for better performance
       await this.createIndexes();
+      startupProfiler.mark('indexes-created');
       
       return this.db;
     } catch (error) {
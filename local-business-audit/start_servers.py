@@ -1,23 +1,156 @@
 #!/usr/bin/env python3
 
+import argparse
+import json
 import os
+import statistics
 import subprocess
+import tempfile
 import time
 import signal
 import sys
 
-def main():
-    print("🚀 Starting Local Business Audit Tool...")
-    
-    # Kill any existing processes
+PROJECT_DIR = "/workspaces/react-audit/local-business-audit"
+
+
+def stop_existing_servers():
+    """Kill any running dev servers (pkill may not exist on every host)."""
     try:
         subprocess.run(["pkill", "-f", "npm.*dev"], stderr=subprocess.DEVNULL)
         time.sleep(2)
     except:
         pass
+
+
+def run_cold_start(backend_dir, timeout):
+    """Start the backend once with the startup profiler enabled and return its report."""
+    fd, report_path = tempfile.mkstemp(prefix="startup-profile-", suffix=".json")
+    os.close(fd)
+    env = dict(os.environ, STARTUP_PROFILE=report_path)
+
+    try:
+        start = time.perf_counter()
+        backend_process = subprocess.Popen(
+            ["node", "server.js"],
+            cwd=backend_dir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            backend_process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            print(f"   ⚠️ Backend not ready after {timeout}s, stopping")
+            # The profiler writes its partial report on SIGUSR2; SIGKILL would lose it
+            backend_process.send_signal(signal.SIGUSR2)
+            try:
+                backend_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                backend_process.kill()
+                backend_process.wait()
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        try:
+            with open(report_path) as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            return None
+        report["wallMs"] = wall_ms
+        return report
+    finally:
+        os.remove(report_path)
+
+
+def print_startup_report(reports, top):
+    """Summarise repeated cold starts: milestone timings and the slowest modules."""
+    def summary(values):
+        return f"median {statistics.median(values):8.1f} ms   max {max(values):8.1f} ms"
+
+    print(f"\n📊 Startup profile over {len(reports)} cold start(s)")
+    print("")
+    print("⏱️  Milestones (ms since process start)")
+    for name in ["modules-loaded", "db-connected", "indexes-created", "listening", "ready"]:
+        values = [r["marks"][name] for r in reports if name in r["marks"]]
+        if values:
+            print(f"   {name:<16} {summary(values)}   ({len(values)}/{len(reports)} runs)")
+        else:
+            print(f"   {name:<16} never reached")
+    print(f"   {'wall clock':<16} {summary([r['wallMs'] for r in reports])}")
+
+    timed_out = [r for r in reports if r.get("timedOut")]
+    failed = [r for r in reports if r["exitCode"] != 0 and not r.get("timedOut")]
+    if timed_out:
+        print(f"   ❌ {len(timed_out)} run(s) timed out before becoming ready")
+    if failed:
+        print(f"   ❌ {len(failed)} run(s) exited with an error before becoming ready (check MONGODB_URI / port 5000)")
+
+    # server.js's direct requires are the candidates for lazy loading
+    inclusive = {}
+    self_time = {}
+    for report in reports:
+        for module in report["modules"]:
+            self_time.setdefault(module["id"], []).append(module["selfMs"])
+            if module["parent"] == "server.js":
+                inclusive.setdefault(module["id"], []).append(module["inclusiveMs"])
+
+    def slowest(times):
+        return sorted(times.items(), key=lambda item: statistics.median(item[1]), reverse=True)[:top]
+
+    print("")
+    print(f"🐢 Slowest requires from server.js (including their dependencies, top {top})")
+    for module_id, values in slowest(inclusive):
+        print(f"   {summary(values)}   {module_id}")
+
+    print("")
+    print(f"🔍 Slowest individual modules (own load time, top {top})")
+    for module_id, values in slowest(self_time):
+        print(f"   {summary(values)}   {module_id}")
+
+
+def profile_startup(runs, top, timeout):
+    print(f"🔬 Profiling backend cold start ({runs} run(s))...")
+
+    backend_dir = os.path.join(PROJECT_DIR, "backend")
+    reports = []
+    for run in range(1, runs + 1):
+        print(f"   Run {run}/{runs}...")
+        report = run_cold_start(backend_dir, timeout)
+        if report is None:
+            print("   ❌ No profile written - did node start at all?")
+            continue
+        reports.append(report)
+
+    if not reports:
+        print("❌ No startup profiles collected")
+        return
+
+    print_startup_report(reports, top)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Start the Local Business Audit Tool servers")
+    profiling = parser.add_argument_group("startup profiling")
+    profiling.add_argument("--profile-startup", type=int, metavar="RUNS", nargs="?", const=5,
+                           help="profile backend cold starts instead of starting the servers (default 5 runs)")
+    profiling.add_argument("--top", type=int, default=15,
+                           help="number of slowest modules to show (only with --profile-startup)")
+    profiling.add_argument("--timeout", type=int, default=60,
+                           help="seconds to wait for each cold start (only with --profile-startup)")
+    args = parser.parse_args()
+
+    if args.profile_startup is not None:
+        # Kill any existing processes so port 5000 is free
+        stop_existing_servers()
+        profile_startup(args.profile_startup, args.top, args.timeout)
+        return
+
+    print("🚀 Starting Local Business Audit Tool...")
+    
+    # Kill any existing processes
+    stop_existing_servers()
     
     # Navigate to project directory
-    project_dir = "/workspaces/react-audit/local-business-audit"
+    project_dir = PROJECT_DIR
     
     if not os.path.exists(project_dir):
         print(f"❌ Project directory not found: {project_dir}")